@@ -0,0 +1,135 @@
+"""
+Fixture generation shared by the python/v<version>/generate_fixtures.py scripts.
+
+Each version script runs in its own environment and pins the spatialdata
+release it generates for; everything else about generating and writing the
+blobs fixture is the same across releases and lives here. spatialdata is only
+imported once generation starts, so `--help` stays cheap.
+"""
+
+import argparse
+import shutil
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+ELEMENT_TYPES = ("images", "labels", "points", "shapes", "tables")
+
+
+def write_store(sdata, version_dir: Path) -> Path:
+    """Write sdata to version_dir/blobs.zarr, replacing any previous store."""
+    store_path = version_dir / "blobs.zarr"
+    # The store is written under a sibling name and renamed into place once
+    # complete, so blobs.zarr is only ever a finished store: the integration
+    # tests take any blobs.zarr they find as already generated.
+    tmp_path = version_dir / "blobs.tmp.zarr"
+    old_path = version_dir / "blobs.old.zarr"
+
+    # Leftovers of an interrupted run
+    for leftover in (tmp_path, old_path):
+        shutil.rmtree(leftover, ignore_errors=True)
+
+    print(f"Saving to {store_path}...")
+
+    # Use spatialdata's write method
+    # The API may vary by version, so we try different methods
+    try:
+        try:
+            # Try the standard write method with overwrite (most common)
+            sdata.write(tmp_path, overwrite=True)
+        except TypeError:
+            # If overwrite parameter doesn't exist, try without it
+            # (older versions might not support it)
+            sdata.write(tmp_path)
+    except BaseException:
+        # The previous store, if any, is left as it was
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    # Only now move any existing store aside (to allow regenerating fixtures)
+    # and swap the new one in. The old one is deleted in the background; the
+    # interpreter waits for the thread before exiting.
+    try:
+        store_path.rename(old_path)
+        print(f"Replacing existing fixture at {store_path}...")
+    except FileNotFoundError:
+        pass
+    tmp_path.rename(store_path)
+    threading.Thread(target=shutil.rmtree, args=(old_path,), kwargs={"ignore_errors": True}).start()
+
+    return store_path
+
+
+def summarize(sdata) -> str:
+    """Some metadata about what was generated, as printed after writing."""
+    # Element containers are dict-like, keyed by element name, in every
+    # release; types with no elements are left out.
+    lines = ["", "Generated elements:"]
+    for element_type in ELEMENT_TYPES:
+        names = list(getattr(sdata, element_type, None) or [])
+        if names:
+            lines.append(f"  - {element_type}: {len(names)} element(s)")
+            lines.extend(f"    * {name}" for name in names)
+
+    coordinate_systems = getattr(sdata, "coordinate_systems", None)
+    if coordinate_systems is not None:
+        lines += ["", f"Coordinate systems: {list(coordinate_systems)}"]
+    return "\n".join(lines)
+
+
+def generate_fixtures(output_dir: Path, version: str, prepare: Callable | None = None) -> Path:
+    """
+    Generate the blobs fixture for spatialdata `version` under output_dir.
+
+    `prepare` is called with the dataset before it is written, for releases
+    that need it adjusted to write at all.
+    """
+    from spatialdata.datasets import blobs
+    import spatialdata as sd
+    print(f"Generating fixtures for spatialdata version {version}...")
+
+    # Verify we're using the correct version
+    actual_version = sd.__version__
+    if actual_version != version:
+        print(f"⚠️  Warning: Expected version {version} but got {actual_version}")
+        print("   This may indicate the wrong environment is active.")
+
+    # Create output directory
+    version_dir = output_dir / f"v{version}"
+    version_dir.mkdir(parents=True, exist_ok=True)
+
+    # Generate a simple spatialdata object using blobs dataset
+    print("Creating spatialdata object with blobs dataset...")
+    sdata = blobs()
+    if prepare is not None:
+        prepare(sdata)
+
+    store_path = write_store(sdata, version_dir)
+    print(f"✓ Generated fixture at {store_path}")
+
+    print(summarize(sdata))
+    print(f"\nUsing spatialdata version {actual_version}")
+
+    return store_path
+
+
+def main(version: str, generate: Callable[[Path], Path]):
+    """Command line entry point of a version script, whose generate_fixtures is `generate`."""
+    parser = argparse.ArgumentParser(
+        description=f"Generate test fixtures for SpatialData.ts using spatialdata {version}"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="test-fixtures",
+        help="Output directory for fixtures (default: test-fixtures)",
+    )
+
+    args = parser.parse_args()
+
+    # Get project root (parent of python/ directory)
+    project_root = Path(__file__).parent.parent.parent
+    output_dir = project_root / args.output_dir
+
+    generate(output_dir)
+    print("\n✓ Fixtures generated successfully!")
@@ -9,18 +9,53 @@ To add a release: create python/v<version>/ (pyproject.toml pinning
 spatialdata==<version>, plus generate_fixtures.py), add it to VERSIONS below, and
 add it to FIXTURE_VERSIONS in tests/integration/fixtureVersions.ts. The CI cache
 key in .github/workflows/test.yml hashes python/v*/, so it invalidates itself.
+The version scripts share their generation code in fixture_generation.py.
+
+Locally, a version whose store was generated from its current script and
+uv.lock is skipped; pass --force to regenerate it anyway.
 """
 
 import argparse
-import os
+import hashlib
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from version_envs import env_dir_for, lock_digest, subprocess_env, sync_envs, venv_python
+
 # Oldest first; the last entry is the current release that docs and
 # single-version CI jobs track.
 VERSIONS = ["0.5.0", "0.6.1", "0.7.2", "0.8.0"]
 
+# Written next to a version's generated store. It holds a digest of what the
+# store was generated from, so an unchanged version can skip its environment
+# sync and generation entirely.
+FIXTURE_STAMP = ".generated-from"
+
+# The generation code every version script imports
+SHARED_GENERATION = Path(__file__).parent / "fixture_generation.py"
+
+
+def fixture_digest(env_dir: Path) -> str:
+    """Digest of the version script, the generation it shares and the environment it runs in."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(lock_digest(env_dir).encode())
+    digest.update((env_dir / "generate_fixtures.py").read_bytes())
+    digest.update(SHARED_GENERATION.read_bytes())
+    return digest.hexdigest()
+
+
+def fixtures_current(env_dir: Path, version_dir: Path) -> bool:
+    """True if version_dir holds a store generated from env_dir as it is now."""
+    try:
+        return (
+            (version_dir / "blobs.zarr").is_dir()
+            and (version_dir / FIXTURE_STAMP).read_text() == fixture_digest(env_dir)
+        )
+    except FileNotFoundError:
+        return False
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -39,6 +74,11 @@ def main():
         default="test-fixtures",
         help="Output directory for fixtures (default: test-fixtures)",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate fixtures even if they were generated from the current script and uv.lock",
+    )
     
     args = parser.parse_args()
     
@@ -50,8 +90,9 @@ def main():
     versions = [args.version] if args.version else VERSIONS
     
     success = True
+    ready = []
     for version in versions:
-        env_dir = project_root / "python" / f"v{version}"
+        env_dir = env_dir_for(project_root, version)
         version_script = env_dir / "generate_fixtures.py"
         
         if not version_script.exists():
@@ -59,45 +100,74 @@ def main():
             print(f"       Make sure the environment directory exists: {env_dir}")
             success = False
             continue
-        
-        # Ensure the environment is set up
+        if not args.force and fixtures_current(env_dir, output_dir / f"v{version}"):
+            print(f"Fixtures for {version} already generated from this script and uv.lock; skipping (--force to regenerate)")
+            continue
+        ready.append(version)
+    
+    # Ensure the environments are set up; the syncs are independent, so they
+    # run concurrently before any generation starts
+    if ready:
         print(f"\n{'='*60}")
-        print(f"Setting up environment for spatialdata {version}...")
+        print(f"Setting up environments for spatialdata {', '.join(ready)}...")
         print(f"{'='*60}")
-        env = os.environ.copy()
-        env.pop("VIRTUAL_ENV", None)
-        sync_result = subprocess.run(
-            ["uv", "sync", "--directory", str(env_dir)],
-            cwd=project_root,
-            env=env,
-            capture_output=True,
-            text=True,
-        )
+    sync_results = sync_envs([env_dir_for(project_root, v) for v in ready], project_root)
+    env = subprocess_env()
+    
+    # Each version writes its own output directory from its own environment, so
+    # the generation runs are independent too: they run concurrently, and each
+    # one's output is printed as a block, in version order, once it finishes
+    generating = []
+    for version, sync_result in zip(ready, sync_results):
+        env_dir = env_dir_for(project_root, version)
         
-        if sync_result.returncode != 0:
+        if sync_result is None:
+            print(f"Environment for {version} already up to date with uv.lock; skipping uv sync")
+        elif sync_result.returncode != 0:
             print(f"Error setting up environment for version {version}:")
             print(sync_result.stderr)
             success = False
             continue
         
-        # Run the version-specific script in its environment
-        print(f"\n{'='*60}")
-        print(f"Generating fixtures for spatialdata {version}...")
-        print(f"{'='*60}")
-        result = subprocess.run(
+        # A failed run must not leave the previous stamp vouching for its store
+        (output_dir / f"v{version}" / FIXTURE_STAMP).unlink(missing_ok=True)
+        generating.append(version)
+    
+    # Output is only captured when versions really do run side by side; a single
+    # version (every CI step, and ensureFixtures) streams its progress as it goes
+    concurrent = len(generating) > 1
+    
+    def generate(version: str) -> subprocess.CompletedProcess:
+        """Run the version-specific script in its environment."""
+        env_dir = env_dir_for(project_root, version)
+        capture = {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True} if concurrent else {}
+        return subprocess.run(
             [
-                "uv", "run",
-                "--directory", str(env_dir),
-                str(version_script),
+                str(venv_python(env_dir)),
+                str(env_dir / "generate_fixtures.py"),
                 "--output-dir", str(output_dir),
             ],
             cwd=project_root,
             env=env,
+            **capture,
         )
-        
-        if result.returncode != 0:
-            print(f"Failed to generate fixtures for version {version}")
-            success = False
+    
+    with ThreadPoolExecutor(max_workers=max(len(generating), 1)) as executor:
+        running = {version: executor.submit(generate, version) for version in generating} if concurrent else {}
+        for version in generating:
+            print(f"\n{'='*60}")
+            print(f"Generating fixtures for spatialdata {version}...")
+            print(f"{'='*60}", flush=True)
+            result = running[version].result() if concurrent else generate(version)
+            if result.stdout is not None:
+                print(result.stdout, end="", flush=True)
+            
+            if result.returncode != 0:
+                print(f"Failed to generate fixtures for version {version}")
+                success = False
+            else:
+                env_dir = env_dir_for(project_root, version)
+                (output_dir / f"v{version}" / FIXTURE_STAMP).write_text(fixture_digest(env_dir))
     
     if success:
         print("\n" + "="*60)
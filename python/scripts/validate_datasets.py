@@ -8,14 +8,30 @@ to establish a baseline of what works with each version.
 """
 
 import argparse
+import asyncio
+import csv
+import hashlib
+import io
+import itertools
 import json
+import os
+import signal
 import subprocess
 import sys
-from dataclasses import dataclass, asdict
+import tempfile
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TextIO
 from datetime import datetime
-from multiprocessing import Pool, cpu_count
+
+from version_envs import env_dir_for, lock_digest, subprocess_env, sync_envs, venv_python
+
+try:
+    import orjson
+except ImportError:  # optional: only speeds up result parsing and the JSON report
+    orjson = None
 
 # The spatialdata releases to validate against, oldest first. Each needs a
 # matching python/v<version>/ environment; keep in step with VERSIONS in
@@ -36,8 +52,14 @@ class ValidationResult:
     coordinate_systems: Optional[list] = None
 
     def to_dict(self):
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        A shallow copy: the fields are already JSON-ready, and the serializer
+        only reads the nested elements / coordinate_systems containers, so the
+        recursive deep copy `dataclasses.asdict` makes is not needed.
+        """
+        return dict(vars(self))
 
 
 # Dataset definitions from https://spatialdata.scverse.org/en/stable/tutorials/notebooks/datasets/README.html
@@ -85,124 +107,383 @@ DATASETS = [
 ]
 
 
-def validate_with_version(dataset: dict, version: str, project_root: Path, verbose: bool = False) -> ValidationResult:
+# Per-dataset budget, enforced by the worker on the child loading the dataset
+TASK_TIMEOUT = 120
+
+# Extra time the orchestrator allows on top of TASK_TIMEOUT before giving up on
+# a whole worker: the first requests to a new worker also wait for its startup
+# and `import spatialdata`.
+STARTUP_TIMEOUT = 120
+
+# How much of a broken worker's stderr to quote in its result
+STDERR_TAIL = 4000
+
+# Longest reply line a worker may send; asyncio's default of 64 KiB could be
+# outgrown by a store with very many elements.
+RESULT_LINE_LIMIT = 16 * 1024 * 1024
+
+# Started with `-m` from its own directory rather than as a script path: only
+# modules loaded through the import system get their bytecode cached in
+# __pycache__, so each worker start after the first skips compiling it.
+WORKER_MODULE = "validate_worker"
+
+
+class WorkerExited(RuntimeError):
+    """A validation worker closed its output without answering a request."""
+
+
+class ValidationWorker:
     """
-    Validate a dataset with a specific spatialdata version.
+    One long-lived validate_worker.py process inside a version-specific environment.
 
-    This runs a subprocess with the version-specific environment to test loading the dataset.
+    It is shared by every task for its version: requests are tagged with an id,
+    the worker loads each in its own forked child, and a reader task hands the
+    replies, which arrive in completion order, back to the waiting tasks.
     """
-    env_dir = project_root / "python" / f"v{version}"
 
-    if verbose:
-        print(f"    Loading spatialdata library (v{version})...", file=sys.stderr, flush=True)
+    def __init__(self, process: asyncio.subprocess.Process, stderr):
+        self.process = process
+        self._stderr = stderr
+        self._pending: dict[str, asyncio.Future] = {}
+        self._ids = itertools.count()
+        self._error: Optional[Exception] = None
+        self._reader = asyncio.create_task(self._read_results())
+
+    @classmethod
+    async def start(
+        cls, version: str, project_root: Path, verbose: bool = False, chunk_cache: Optional[Path] = None
+    ) -> "ValidationWorker":
+        env_dir = env_dir_for(project_root, version)
+        env = subprocess_env()
+        if chunk_cache is not None:
+            # fsspec reads FSSPEC_<PROTOCOL>_<KWARG> into its per-protocol defaults
+            # at import, so this reaches every simplecache:: URL the worker opens,
+            # however deep inside spatialdata, zarr or ome-zarr it is resolved.
+            env["FSSPEC_SIMPLECACHE_CACHE_STORAGE"] = str(chunk_cache)
+        if verbose:
+            print(f"    Loading spatialdata library (v{version})...", file=sys.stderr, flush=True)
+        # Loading logs a lot to stderr. Unless it is being watched, it goes to an
+        # unnamed file that is never read on the happy path, rather than a pipe
+        # that would have to be drained and decoded on every task. Each child
+        # gets a file of its own, so a failure is reported with only its output.
+        stderr = None if verbose else tempfile.TemporaryFile()
+        command = [str(venv_python(env_dir)), "-m", WORKER_MODULE, "--timeout", str(TASK_TIMEOUT)]
+        if not verbose:
+            command.append("--isolate-stderr")
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=stderr,
+            cwd=Path(__file__).parent,
+            env=env,
+            limit=RESULT_LINE_LIMIT,
+            # In a process group of its own, with the children it forks, so
+            # kill() can take them all down together
+            start_new_session=True,
+        )
+        return cls(process, stderr)
 
-    # Create a temporary Python script to run in the version-specific environment
-    test_script = f"""
-import sys
-import json
-import spatialdata as sd
+    @property
+    def exited(self) -> bool:
+        return self._error is not None
 
-def test_load():
-    try:
-        print("Loading dataset...", file=sys.stderr, flush=True)
-        # Try to read the dataset
-        sdata = sd.read_zarr({json.dumps(dataset['url'])})
-
-        # Extract basic info
-        elements = {{}}
-        for element_type in ["images", "labels", "points", "shapes", "tables"]:
-            if hasattr(sdata, element_type):
-                attr = getattr(sdata, element_type)
-                if isinstance(attr, dict):
-                    elements[element_type] = list(attr.keys())
-                elif attr is not None:
-                    elements[element_type] = True
-
-        # Get coordinate systems
-        coordinate_systems = None
-        if hasattr(sdata, "coordinate_systems"):
-            cs = sdata.coordinate_systems
-            if isinstance(cs, dict):
-                coordinate_systems = list(cs.keys())
-            elif isinstance(cs, list):
-                coordinate_systems = cs
-            elif cs is not None:
-                coordinate_systems = [str(cs)]
-
-        result = {{
-            "success": True,
-            "elements": elements,
-            "coordinate_systems": coordinate_systems,
-        }}
-        print(json.dumps(result))
+    async def _read_results(self):
+        try:
+            async for line in self.process.stdout:
+                output = orjson.loads(line) if orjson else json.loads(line)
+                future = self._pending.pop(output.pop("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(output)
+            error = WorkerExited(f"validation worker exited with code {await self.process.wait()}")
+            # Children of a worker that died are left without their deadline
+            self.kill()
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            # A reply that is not JSON, is over RESULT_LINE_LIMIT, or is not an
+            # object with an id: replies can no longer be matched to requests
+            self.kill()
+            error = e if isinstance(e, json.JSONDecodeError) else WorkerExited(f"unreadable reply from validation worker: {e!r}")
+        self._error = error
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def validate(self, url: str, timeout: float) -> dict:
+        """Send one dataset URL and wait up to `timeout` seconds for its JSON result."""
+        if self._error is not None:
+            raise self._error
+        request_id = str(next(self._ids))
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        self.process.stdin.write(f"{request_id}\t{url}\n".encode())
+        await self.process.stdin.drain()
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            # The worker enforces TASK_TIMEOUT itself, so it has stopped
+            # answering altogether; fail everything still waiting on it.
+            self.kill()
+            raise TimeoutError(f"Dataset loading timed out after {timeout:g} seconds, with the worker not responding") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def close(self):
+        """Let the worker finish on end of input, killing it if it does not."""
+        try:
+            self.process.stdin.close()
+            await asyncio.wait_for(self.process.wait(), 5)
+        except (OSError, asyncio.TimeoutError):
+            self.kill()
+        await self._reader
+        if self._stderr is not None:
+            self._stderr.close()
+
+    def kill(self):
+        """Kill the worker and any children it has forked that are still loading."""
+        # Marked dead at once, not when the reader next sees EOF, so the pool
+        # replaces it and no further request is written to it meanwhile
+        if self._error is None:
+            self._error = WorkerExited("validation worker was killed")
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
 
-    except Exception as e:
-        error_type = type(e).__name__
-        error_message = str(e)
-        result = {{
-            "success": False,
-            "error_type": error_type,
-            "error_message": error_message,
-        }}
-        print(json.dumps(result))
-        sys.exit(1)
+    def stderr_tail(self) -> str:
+        """
+        The end of what the worker wrote to stderr, for diagnosing a failure.
 
-if __name__ == "__main__":
-    test_load()
-"""
+        Read by offset so the file position the worker writes at is left alone.
+        """
+        if self._stderr is None:
+            return ""
+        size = os.fstat(self._stderr.fileno()).st_size
+        start = max(0, size - STDERR_TAIL)
+        return os.pread(self._stderr.fileno(), size - start, start).decode(errors="replace").strip()
 
-    # Run the test script in the version-specific environment
-    try:
-        result = subprocess.run(
-            ["uv", "run", "--directory", str(env_dir), "python", "-c", test_script],
-            capture_output=True,
-            text=True,
-            timeout=120,  # 2 minute timeout per dataset
-            cwd=project_root,
-        )
 
-        # Parse the JSON output
+class WorkerPool:
+    """
+    One ValidationWorker per spatialdata version, shared by all of its tasks.
+
+    A worker is started on first use and replaced if it dies, so each version
+    pays for `import spatialdata` once however many of its datasets are loading
+    at the same time.
+    """
+
+    def __init__(self, project_root: Path, verbose: bool = False, chunk_cache: Optional[Path] = None):
+        self.project_root = project_root
+        self.verbose = verbose
+        self.chunk_cache = chunk_cache
+        self._workers: dict[str, ValidationWorker] = {}
+        self._all: list[ValidationWorker] = []
+        self._lock = asyncio.Lock()
+
+    async def worker(self, version: str) -> ValidationWorker:
+        async with self._lock:
+            worker = self._workers.get(version)
+            if worker is None or worker.exited:
+                worker = await ValidationWorker.start(version, self.project_root, self.verbose, self.chunk_cache)
+                self._workers[version] = worker
+                self._all.append(worker)
+            return worker
+
+    def source_url(self, url: str) -> str:
+        """
+        The URL a worker should load a dataset from.
+
+        With a chunk cache, reads go through fsspec's simplecache, which keeps each
+        fetched object under the cache directory and serves repeat reads from disk.
+        """
+        return f"simplecache::{url}" if self.chunk_cache is not None else url
+
+    async def __aenter__(self) -> "WorkerPool":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.gather(*(worker.close() for worker in self._all))
+
+
+# Root metadata documents of a zarr v2 / v3 group, probed in this order. The
+# store prefix itself is not an object, so a HEAD on the dataset URL 404s even
+# for a healthy store. Only consolidated metadata changes whenever any group or
+# array in the store does, so only its ETag can key a cached result: that is
+# .zmetadata, or zarr.json when it carries consolidated_metadata. A bare
+# .zgroup proves the store exists but says nothing about its contents.
+ROOT_METADATA = (".zmetadata", ".zgroup", "zarr.json")
+PREFLIGHT_TIMEOUT = 5
+# Statuses that say a document is not there. Anything else, such as a 5xx or
+# a 429 from an overloaded bucket, is inconclusive like a timeout.
+MISSING_STATUSES = (403, 404, 410)
+
+
+@dataclass
+class Preflight:
+    """What a preflight check learned about a dataset before any worker loads it."""
+    unreachable: Optional[str] = None
+    etag: Optional[str] = None
+
+
+def _consolidated_etag(name: str, response) -> Optional[str]:
+    """The ETag of a root metadata document, if it covers the whole store."""
+    if name == ".zmetadata":
+        return response.headers.get("ETag")
+    if name == "zarr.json":
+        document = json.loads(response.read())
+        if isinstance(document, dict) and document.get("consolidated_metadata"):
+            return response.headers.get("ETag")
+    return None
+
+
+def preflight(url: str) -> Preflight:
+    """
+    Cheaply check that a remote dataset exists before a worker loads it.
+
+    Records why the dataset is unreachable if every root metadata probe is
+    answered as missing, and otherwise the ETag of its consolidated metadata,
+    if it has any. Server errors, timeouts and connection errors prove nothing,
+    so those datasets are left for the worker to load and report on.
+    """
+    if not url.startswith(("http://", "https://")):
+        return Preflight()
+    statuses = []
+    for name in ROOT_METADATA:
+        # zarr.json is fetched rather than probed, to see whether it is consolidated
+        method = "GET" if name == "zarr.json" else "HEAD"
+        request = urllib.request.Request(url.rstrip("/") + "/" + name, method=method)
         try:
-            output = json.loads(result.stdout.strip().split('\n')[-1])
-            return ValidationResult(
-                dataset_name=dataset["name"],
-                dataset_url=dataset["url"],
-                spatialdata_version=version,
-                success=output.get("success", False),
-                error_type=output.get("error_type"),
-                error_message=output.get("error_message"),
-                elements=output.get("elements"),
-                coordinate_systems=output.get("coordinate_systems"),
-            )
-        except (json.JSONDecodeError, IndexError) as e:
-            # If we couldn't parse the output, something went wrong
-            return ValidationResult(
-                dataset_name=dataset["name"],
-                dataset_url=dataset["url"],
-                spatialdata_version=version,
-                success=False,
-                error_type="ParseError",
-                error_message=f"Could not parse output: {result.stdout}\nStderr: {result.stderr}",
-            )
+            with urllib.request.urlopen(request, timeout=PREFLIGHT_TIMEOUT) as response:
+                return Preflight(etag=_consolidated_etag(name, response))
+        except urllib.error.HTTPError as e:
+            if e.code not in MISSING_STATUSES:
+                return Preflight()
+            statuses.append(f"{name}: HTTP {e.code}")
+        except Exception:
+            # Timeouts, refused connections and malformed or truncated responses
+            # (http.client.HTTPException is not an OSError) are all inconclusive
+            return Preflight()
+    return Preflight(unreachable=f"No zarr group metadata found at {url} ({', '.join(statuses)})")
+
+
+class ResultCache:
+    """
+    Successful ValidationResults kept on disk between runs.
+
+    A result is keyed by the dataset URL, its ETag from the preflight, the
+    worker that loaded it and the exact environment it ran in, so a re-run only
+    reloads datasets that changed remotely, versions whose uv.lock changed, or
+    everything after an edit to validate_worker.py. Failures are never
+    stored: they are as likely to be a flaky network as a real incompatibility.
+    """
+
+    def __init__(self, directory: Path, project_root: Path, versions: list[str], refresh: bool = False):
+        self.directory = directory
+        self.refresh = refresh
+        # A change to the worker can change what it reports, so it invalidates everything
+        worker_source = Path(__file__).with_name(f"{WORKER_MODULE}.py").read_bytes()
+        self._worker = hashlib.blake2b(worker_source, digest_size=16).hexdigest()
+        self._locks = {}
+        for version in versions:
+            try:
+                self._locks[version] = lock_digest(env_dir_for(project_root, version))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, url: str, version: str, etag: Optional[str]) -> Optional[Path]:
+        if etag is None or version not in self._locks:
+            return None
+        key = hashlib.blake2b(f"{url}|{version}|{etag}|{self._locks[version]}|{self._worker}".encode(), digest_size=16)
+        return self.directory / f"{key.hexdigest()}.json"
+
+    def get(self, dataset: dict, version: str, etag: Optional[str]) -> Optional[ValidationResult]:
+        path = self._path(dataset["url"], version, etag)
+        if path is None or self.refresh:
+            return None
+        try:
+            result = ValidationResult(**json.loads(path.read_bytes()))
+        except (FileNotFoundError, ValueError, TypeError):
+            return None
+        # Keyed by URL, so follow any rename in DATASETS
+        result.dataset_name = dataset["name"]
+        return result
+
+    def put(self, result: ValidationResult, etag: Optional[str]):
+        path = self._path(result.dataset_url, result.spatialdata_version, etag)
+        if path is None or not result.success:
+            return
+        # Written whole and renamed into place, so a reader never sees half a file
+        with tempfile.NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as out:
+            json.dump(result.to_dict(), out)
+        os.replace(out.name, path)
+
+
+async def validate_with_version(
+    dataset: dict,
+    version: str,
+    pool: WorkerPool,
+    probe: Optional[Preflight] = None,
+    cache: Optional[ResultCache] = None,
+) -> ValidationResult:
+    """
+    Validate a dataset with a specific spatialdata version.
 
-    except subprocess.TimeoutExpired:
+    The dataset is loaded by a persistent worker running in the version-specific
+    environment, unless `probe` carries a preflight failure for it or `cache`
+    holds a result for it from an earlier run.
+    """
+    probe = probe or Preflight()
+
+    def failed(error_type: str, error_message: str) -> ValidationResult:
         return ValidationResult(
             dataset_name=dataset["name"],
             dataset_url=dataset["url"],
             spatialdata_version=version,
             success=False,
-            error_type="TimeoutError",
-            error_message="Dataset loading timed out after 120 seconds",
+            error_type=error_type,
+            error_message=error_message,
         )
+
+    if probe.unreachable:
+        return failed("HTTPError", probe.unreachable)
+    if cache is not None and (cached := cache.get(dataset, version, probe.etag)):
+        return cached
+
+    worker = None
+
+    def diagnostics() -> str:
+        # Failures raised here are of the whole worker; a failing dataset's own
+        # stderr comes back in its result.
+        tail = worker.stderr_tail() if worker is not None else ""
+        return f"\nStderr: {tail}" if tail else ""
+
+    try:
+        worker = await pool.worker(version)
+        output = await worker.validate(pool.source_url(dataset["url"]), timeout=TASK_TIMEOUT + STARTUP_TIMEOUT)
+    except TimeoutError as e:
+        return failed("TimeoutError", f"{e}{diagnostics()}")
+    except json.JSONDecodeError as e:
+        return failed("ParseError", f"Could not parse output: {e.doc}{diagnostics()}")
     except Exception as e:
-        return ValidationResult(
-            dataset_name=dataset["name"],
-            dataset_url=dataset["url"],
-            spatialdata_version=version,
-            success=False,
-            error_type=type(e).__name__,
-            error_message=str(e),
-        )
+        return failed(type(e).__name__, f"{e}{diagnostics()}")
+
+    result = ValidationResult(
+        dataset_name=dataset["name"],
+        dataset_url=dataset["url"],
+        spatialdata_version=version,
+        success=output.get("success", False),
+        error_type=output.get("error_type"),
+        error_message=output.get("error_message"),
+        elements=output.get("elements"),
+        coordinate_systems=output.get("coordinate_systems"),
+    )
+    if cache is not None:
+        cache.put(result, probe.etag)
+    return result
+
+
+# Summary-table glyph for a result's success, or None when the version was not tested
+STATUS = {True: "✅", False: "❌", None: "⏭️"}
 
 
 def generate_markdown_table(results: list[ValidationResult]) -> str:
@@ -211,96 +492,61 @@ def generate_markdown_table(results: list[ValidationResult]) -> str:
     # Group results by dataset
     datasets = {}
     for result in results:
-        if result.dataset_name not in datasets:
-            datasets[result.dataset_name] = {}
-        datasets[result.dataset_name][result.spatialdata_version] = result
-
-    # Generate table
-    lines = []
-    lines.append("# SpatialData Dataset Compatibility Report")
-    lines.append(f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append("| Dataset | " + " | ".join(f"v{v}" for v in VERSIONS) + " | URL |")
-    lines.append("|---------|" + "|".join("--------" for _ in VERSIONS) + "|-----|")
-
-    for dataset_name in sorted(datasets.keys()):
-        versions = datasets[dataset_name]
-        per_version = [versions.get(v) for v in VERSIONS]
+        datasets.setdefault(result.dataset_name, {})[result.spatialdata_version] = result
+
+    summary = [
+        "# SpatialData Dataset Compatibility Report",
+        f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n",
+        "## Summary",
+        "",
+        "| Dataset | " + " | ".join(f"v{v}" for v in VERSIONS) + " | URL |",
+        "|---------|" + "|".join("--------" for _ in VERSIONS) + "|-----|",
+    ]
+    details = io.StringIO()
+    details.write("## Detailed Results\n")
 
-        statuses = [
-            "✅" if r and r.success else "❌" if r else "⏭️"
-            for r in per_version
-        ]
+    # One pass per dataset fills both the summary row and its detail section
+    for dataset_name in sorted(datasets):
+        versions = datasets[dataset_name]
+        per_version = [(v, versions.get(v)) for v in VERSIONS]
 
+        statuses = " | ".join(STATUS[r.success if r else None] for _, r in per_version)
         # Get URL from first available result
-        first = next((r for r in per_version if r), None)
-        url = first.dataset_url if first else ""
-        url_short = url.split("spatialdata-sandbox/")[-1] if "spatialdata-sandbox/" in url else url
-
-        lines.append(f"| {dataset_name} | " + " | ".join(statuses) + f" | `{url_short}` |")
+        url = next((r.dataset_url for _, r in per_version if r), "")
+        url_short = url.split("spatialdata-sandbox/")[-1]
+        summary.append(f"| {dataset_name} | {statuses} | `{url_short}` |")
 
-    lines.append("")
-    lines.append("Legend: ✅ Success | ❌ Failed | ⏭️ Not tested")
-    lines.append("")
-
-    # Add detailed error information
-    lines.append("## Detailed Results")
-    lines.append("")
-
-    for dataset_name in sorted(datasets.keys()):
-        versions = datasets[dataset_name]
-        lines.append(f"### {dataset_name}")
-        lines.append("")
-
-        for version in VERSIONS:
-            result = versions.get(version)
+        details.write(f"\n### {dataset_name}\n\n")
+        for version, result in per_version:
             if not result:
                 continue
-
-            lines.append(f"#### spatialdata v{version}")
-            lines.append("")
-
+            details.write(f"#### spatialdata v{version}\n\n")
             if result.success:
-                lines.append("**Status:** ✅ Success")
-                lines.append("")
-
+                details.write("**Status:** ✅ Success\n\n")
                 if result.elements:
-                    lines.append("**Elements:**")
+                    details.write("**Elements:**\n")
                     for element_type, items in result.elements.items():
-                        if isinstance(items, list):
-                            lines.append(f"- {element_type}: {', '.join(items)}")
-                        else:
-                            lines.append(f"- {element_type}: present")
-                    lines.append("")
-
+                        listed = ", ".join(items) if isinstance(items, list) else "present"
+                        details.write(f"- {element_type}: {listed}\n")
+                    details.write("\n")
                 if result.coordinate_systems:
-                    lines.append(f"**Coordinate Systems:** {', '.join(result.coordinate_systems)}")
-                    lines.append("")
+                    details.write(f"**Coordinate Systems:** {', '.join(result.coordinate_systems)}\n\n")
             else:
-                lines.append("**Status:** ❌ Failed")
-                lines.append("")
-                lines.append(f"**Error Type:** `{result.error_type}`")
-                lines.append("")
-                lines.append("**Error Message:**")
-                lines.append("```")
-                lines.append(result.error_message or "No error message")
-                lines.append("```")
-                lines.append("")
-
-        lines.append("---")
-        lines.append("")
-
-    return "\n".join(lines)
+                details.write(
+                    "**Status:** ❌ Failed\n\n"
+                    f"**Error Type:** `{result.error_type}`\n\n"
+                    "**Error Message:**\n"
+                    f"```\n{result.error_message or 'No error message'}\n```\n\n"
+                )
+        details.write("---\n")
 
+    summary += ["", "Legend: ✅ Success | ❌ Failed | ⏭️ Not tested", "", details.getvalue()]
+    return "\n".join(summary)
 
-def generate_csv_table(results: list[ValidationResult]) -> str:
-    """Generate a CSV table from validation results."""
-    import csv
-    import io
 
-    output = io.StringIO()
-    writer = csv.writer(output)
+def generate_csv_table(results: list[ValidationResult], out: TextIO):
+    """Write a CSV table of validation results to `out`, a text file opened with newline=""."""
+    writer = csv.writer(out)
 
     # Write header
     writer.writerow([
@@ -330,16 +576,25 @@ def generate_csv_table(results: list[ValidationResult]) -> str:
             cs_str,
         ])
 
-    return output.getvalue()
-
-
-def validate_single(args_tuple):
-    """Helper function for multiprocessing pool."""
-    dataset, version, project_root, verbose = args_tuple
-    return validate_with_version(dataset, version, project_root, verbose)
-
 
-def main():
+def write_output(results: list[ValidationResult], output_format: str, out: TextIO):
+    """Write results in the requested format, streaming rows rather than building the document first."""
+    if output_format == "markdown":
+        out.write(generate_markdown_table(results) + "\n")
+    elif output_format == "csv":
+        generate_csv_table(results, out)
+    elif output_format == "json":
+        payload = [r.to_dict() for r in results]
+        if orjson:
+            out.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode() + "\n")
+        else:
+            # ensure_ascii=False matches orjson's UTF-8 output, so the report is the
+            # same whichever is installed
+            json.dump(payload, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+
+
+async def main():
     parser = argparse.ArgumentParser(
         description="Validate spatialdata dataset compatibility across versions"
     )
@@ -372,14 +627,31 @@ def main():
     parser.add_argument(
         "--workers",
         type=int,
-        default=min(4, cpu_count()),
-        help=f"Number of parallel workers (default: min(4, {cpu_count()}))",
+        default=None,
+        help="Number of datasets validated concurrently (default: two per version)",
     )
     parser.add_argument(
         "--no-parallel",
         action="store_true",
         help="Disable parallel processing (run sequentially)",
     )
+    parser.add_argument(
+        "--chunk-cache",
+        type=Path,
+        default=None,
+        help="Keep fetched zarr objects in this directory and reuse them on later runs (default: no cache)",
+    )
+    parser.add_argument(
+        "--result-cache",
+        type=Path,
+        default=None,
+        help="Directory of results kept from earlier runs (default: .tmp/validation-results)",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Validate every dataset again instead of reusing cached results",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -402,96 +674,130 @@ def main():
                 print(f"  - {d['name']}", file=sys.stderr)
             sys.exit(1)
 
+    # Mark datasets that are not there at all as failed up front, rather than
+    # paying for a worker to find out. The probes also fetch the ETags that
+    # cached results are keyed by. A probe that fails outright is as
+    # inconclusive as one that times out.
+    probes = dict(zip(
+        (d["url"] for d in datasets),
+        (
+            Preflight() if isinstance(probe, Exception) else probe
+            for probe in await asyncio.gather(
+                *(asyncio.to_thread(preflight, d["url"]) for d in datasets),
+                return_exceptions=True,
+            )
+        ),
+    ))
+    for d in datasets:
+        if probes[d["url"]].unreachable:
+            print(f"Skipping {d['name']}: {probes[d['url']].unreachable}", file=sys.stderr)
+
     # Determine versions to test
     versions = [args.version] if args.version else VERSIONS
 
     # Ensure environments are set up
-    for version in versions:
-        env_dir = project_root / "python" / f"v{version}"
-        print(f"Setting up environment for spatialdata {version}...", file=sys.stderr)
-        result = subprocess.run(
-            ["uv", "sync", "--directory", str(env_dir)],
-            cwd=project_root,
-            capture_output=True,
-        )
-        if result.returncode != 0:
+    print(f"Setting up environments for spatialdata {', '.join(versions)}...", file=sys.stderr)
+    sync_results = sync_envs([env_dir_for(project_root, v) for v in versions], project_root)
+    for version, result in zip(versions, sync_results):
+        if result is not None and result.returncode != 0:
             print(f"Error setting up environment for version {version}", file=sys.stderr)
-            print(result.stderr.decode(), file=sys.stderr)
+            print(result.stderr, file=sys.stderr)
             sys.exit(1)
 
     # Run validation
     results = []
     total = len(datasets) * len(versions)
 
+    # Tasks only wait on worker processes, so one event loop keeps them all in
+    # flight. Each one is a forked child of its version's worker, so concurrency
+    # costs memory and bandwidth rather than extra `import spatialdata`s.
+    workers = args.workers or min(total, 2 * len(versions))
+
     print(f"\nValidating {len(datasets)} dataset(s) with {len(versions)} version(s)...", file=sys.stderr)
 
     if args.no_parallel:
         print("Running sequentially (parallel processing disabled)", file=sys.stderr)
     else:
-        print(f"Using {args.workers} parallel worker(s)", file=sys.stderr)
+        print(f"Using {workers} parallel worker(s)", file=sys.stderr)
 
-    print("Note: Most time is spent importing spatialdata, not downloading datasets", file=sys.stderr)
+    print("Note: spatialdata is imported once per version, and each dataset is loaded in a fork of that process", file=sys.stderr)
     print("", file=sys.stderr)
 
     # Prepare arguments for validation
-    validation_tasks = [
-        (dataset, version, project_root, args.verbose)
-        for dataset in datasets
-        for version in versions
-    ]
+    chunk_cache = args.chunk_cache.resolve() if args.chunk_cache else None
+    if chunk_cache is not None:
+        chunk_cache.mkdir(parents=True, exist_ok=True)
+        print(f"Caching fetched zarr objects in {chunk_cache}", file=sys.stderr)
+
+    result_cache_dir = (args.result_cache or project_root / ".tmp" / "validation-results").resolve()
+    result_cache_dir.mkdir(parents=True, exist_ok=True)
+    cache = ResultCache(result_cache_dir, project_root, versions, refresh=args.refresh)
+
+    async with WorkerPool(project_root, args.verbose, chunk_cache) as pool:
+        # Consumed once, by the loop or the runners below, so never built as a list
+        validation_tasks = (
+            (dataset, version, pool, probes[dataset["url"]], cache)
+            for dataset in datasets
+            for version in versions
+        )
 
-    if args.no_parallel:
-        # Sequential processing
-        for i, task in enumerate(validation_tasks):
-            dataset, version, project_root, verbose = task
-            print(f"[{i+1}/{total}] Testing {dataset['name']} with spatialdata v{version}...", file=sys.stderr, flush=True)
-
-            result = validate_with_version(dataset, version, project_root, verbose)
-            results.append(result)
-
-            status = "✅" if result.success else "❌"
-            print(f"        {status} {dataset['name']} (v{version})", file=sys.stderr, flush=True)
-            if not result.success:
-                print(f"           Error: {result.error_type}", file=sys.stderr, flush=True)
-            print("", file=sys.stderr, flush=True)
-    else:
-        # Parallel processing using process pool
-        print("Starting validation pool...", file=sys.stderr, flush=True)
-        print("", file=sys.stderr, flush=True)
+        if args.no_parallel:
+            # Sequential processing
+            for i, task in enumerate(validation_tasks):
+                dataset, version = task[:2]
+                print(f"[{i+1}/{total}] Testing {dataset['name']} with spatialdata v{version}...", file=sys.stderr, flush=True)
 
-        with Pool(processes=args.workers) as pool:
-            # Use imap to get results as they complete
-            for i, result in enumerate(pool.imap(validate_single, validation_tasks)):
+                result = await validate_with_version(*task)
                 results.append(result)
 
                 status = "✅" if result.success else "❌"
-                print(f"[{i+1}/{total}] {status} {result.dataset_name} (v{result.spatialdata_version})", file=sys.stderr, flush=True)
-                if not result.success and args.verbose:
-                    print(f"          Error: {result.error_type}", file=sys.stderr, flush=True)
+                print(f"        {status} {dataset['name']} (v{version})", file=sys.stderr, flush=True)
+                if not result.success:
+                    print(f"           Error: {result.error_type}", file=sys.stderr, flush=True)
+                print("", file=sys.stderr, flush=True)
+        else:
+            # Parallel processing, at most `workers` tasks at a time
+            print("Starting validation pool...", file=sys.stderr, flush=True)
+            print("", file=sys.stderr, flush=True)
+
+            # Each of `workers` runners pulls its next task from the shared
+            # generator only once it is free, so tasks are built as they start.
+            numbered = enumerate(validation_tasks)
+            finished: dict[int, ValidationResult] = {}
+
+            def report():
+                # Collected and printed in task order, so results keep the
+                # dataset/version ordering whatever order they finish in
+                while len(results) in finished:
+                    result = finished.pop(len(results))
+                    results.append(result)
+
+                    status = "✅" if result.success else "❌"
+                    print(f"[{len(results)}/{total}] {status} {result.dataset_name} (v{result.spatialdata_version})", file=sys.stderr, flush=True)
+                    if not result.success and args.verbose:
+                        print(f"          Error: {result.error_type}", file=sys.stderr, flush=True)
+
+            async def runner():
+                for i, task in numbered:
+                    finished[i] = await validate_with_version(*task)
+                    report()
+
+            await asyncio.gather(*(runner() for _ in range(workers)))
 
     print("", file=sys.stderr)
     print("Validation complete!", file=sys.stderr)
     print("", file=sys.stderr)
 
-    # Generate output
-    if args.output_format == "markdown":
-        output = generate_markdown_table(results)
-    elif args.output_format == "csv":
-        output = generate_csv_table(results)
-    elif args.output_format == "json":
-        output = json.dumps([r.to_dict() for r in results], indent=2)
-    else:
-        output = ""
-
     # Write output
     if args.output_file:
         output_path = Path(args.output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output)
+        with open(output_path, "w", newline="", encoding="utf-8") as out:
+            write_output(results, args.output_format, out)
         print(f"Results written to: {output_path}", file=sys.stderr)
     else:
-        print(output)
+        write_output(results, args.output_format, sys.stdout)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
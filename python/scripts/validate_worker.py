@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Long-lived dataset loader for validate_datasets.py.
+
+Runs inside one python/v<version>/ environment. It reads one `<id>\t<url>`
+request per line on stdin and answers each with one line of JSON on stdout,
+carrying the same id. spatialdata is imported once, up front; each dataset is
+then loaded in a child forked from this process, which starts with the import
+already done. Requests run concurrently, one child each, and a child that hangs
+or crashes is killed or reaped without taking the warm parent down with it.
+"""
+
+import argparse
+import json
+import os
+import select
+import signal
+import sys
+import tempfile
+import time
+import traceback
+
+import fsspec
+import spatialdata as sd
+
+# validate_datasets.py sends URLs with this prefix when --chunk-cache is set
+CACHED_PREFIX = "simplecache::"
+
+ELEMENT_TYPES = ("images", "labels", "points", "shapes", "tables")
+
+# fsspec only imports a protocol's implementation (and for http, aiohttp) the
+# first time a URL with it is opened
+REMOTE_PROTOCOLS = ("http", "https", "simplecache")
+
+
+def _metadata_documents(fs, root: str) -> list[str]:
+    """Every metadata document listed in a store's consolidated metadata, zarr v2 or v3."""
+    try:
+        consolidated = json.loads(fs.cat(f"{root}/.zmetadata"))["metadata"]
+        return [f"{root}/{key}" for key in consolidated]
+    except FileNotFoundError:
+        pass
+    group = json.loads(fs.cat(f"{root}/zarr.json"))
+    consolidated = (group.get("consolidated_metadata") or {}).get("metadata") or {}
+    return [f"{root}/{path}/zarr.json" for path in consolidated]
+
+
+def prefetch_metadata(url: str):
+    """
+    Fetch a cached store's metadata documents into the cache in one batch.
+
+    Loading walks the hierarchy one .zattrs / zarr.json at a time, each a serial
+    round trip. Listing them from the consolidated metadata lets the cache fetch
+    them all concurrently first, so the walk itself is served from disk. Without
+    the cache the fetched bytes would be thrown away, so this only runs with it.
+    """
+    if not url.startswith(CACHED_PREFIX):
+        return
+    try:
+        fs, root = fsspec.core.url_to_fs(url)
+        root = root.rstrip("/")
+        fs.cat(_metadata_documents(fs, root), on_error="omit")
+    except Exception as e:
+        # Only an optimisation: loading reports any real problem with the store
+        print(f"Skipping metadata prefetch: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
+
+
+def preload_remote_protocols():
+    """
+    Import the filesystems remote datasets are read through, once, in the parent.
+
+    Children forked afterwards start with them loaded, instead of each paying
+    for the aiohttp import on its first request. Their sessions cannot be shared
+    the same way: fsspec restarts its event loop in a forked child, so each
+    child opens its own, and reuses it for every request in that dataset.
+    """
+    for protocol in REMOTE_PROTOCOLS:
+        try:
+            fsspec.get_filesystem_class(protocol)
+        except ImportError as e:
+            print(f"Not preloading {protocol}: {e}", file=sys.stderr, flush=True)
+
+
+def validate(url: str) -> dict:
+    """Load one dataset and describe what was read, or why it could not be."""
+    try:
+        print(f"Loading dataset {url}...", file=sys.stderr, flush=True)
+        prefetch_metadata(url)
+        sdata = sd.read_zarr(url)
+
+        # spatialdata holds each element type in a dict-like container keyed by
+        # element name; types with no elements are left out.
+        elements = {
+            element_type: list(container.keys())
+            for element_type in ELEMENT_TYPES
+            if (container := getattr(sdata, element_type, None))
+        }
+        coordinate_systems = list(getattr(sdata, "coordinate_systems", None) or [])
+
+        return {
+            "success": True,
+            "elements": elements,
+            "coordinate_systems": coordinate_systems,
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error_type": type(e).__name__,
+            "error_message": str(e),
+        }
+
+
+# How much of a failed child's stderr to quote in its result
+STDERR_TAIL = 4000
+
+
+class Child:
+    """A forked child loading one dataset, and what the parent tracks about it."""
+
+    def __init__(self, request_id: str, url: str, timeout: float, isolate_stderr: bool, inherited: list[int]):
+        self.request_id = request_id
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.output = bytearray()
+        self.stderr = tempfile.TemporaryFile() if isolate_stderr else None
+        read_fd, write_fd = os.pipe()
+        self.pid = os.fork()
+        if self.pid == 0:
+            os.close(read_fd)
+            self._run(url, write_fd, inherited)
+        os.close(write_fd)
+        self.fd = read_fd
+
+    def _run(self, url: str, write_fd: int, inherited: list[int]):
+        """Child side: load the dataset, write its result to the pipe and exit."""
+        # Let go of the parent's results channel, stdin and other children's
+        # pipes. Holding them would keep the orchestrator's end of the worker
+        # open after the parent is killed, so it would never see the worker exit.
+        for fd in inherited:
+            os.close(fd)
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, sys.stdin.fileno())
+        os.close(devnull)
+        if self.stderr is not None:
+            os.dup2(self.stderr.fileno(), sys.stderr.fileno())
+            os.dup2(self.stderr.fileno(), sys.stdout.fileno())
+        code = 1
+        try:
+            with os.fdopen(write_fd, "wb") as out:
+                out.write(json.dumps(validate(url)).encode())
+            code = 0
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            traceback.print_exc()
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # Skip interpreter teardown, which would run the parent's atexit
+            # handlers and flush its buffers a second time
+            os._exit(code)
+
+    def stderr_tail(self) -> str:
+        if self.stderr is None:
+            return ""
+        self.stderr.seek(0, os.SEEK_END)
+        self.stderr.seek(max(0, self.stderr.tell() - STDERR_TAIL))
+        return self.stderr.read().decode(errors="replace").strip()
+
+    def failure(self, error_type: str, error_message: str) -> dict:
+        tail = self.stderr_tail()
+        return {
+            "success": False,
+            "error_type": error_type,
+            "error_message": f"{error_message}\nStderr: {tail}" if tail else error_message,
+        }
+
+    def finish(self, timed_out: bool = False) -> dict:
+        """Reap the child once its output is complete, or kill it, and build its result."""
+        if timed_out:
+            os.kill(self.pid, signal.SIGKILL)
+        _, status = os.waitpid(self.pid, 0)
+        os.close(self.fd)
+        try:
+            if timed_out:
+                return self.failure("TimeoutError", f"Dataset loading timed out after {self.timeout:g} seconds")
+            if not self.output:
+                code = os.waitstatus_to_exitcode(status)
+                return self.failure("WorkerExited", f"validation worker exited with code {code}")
+            try:
+                return json.loads(self.output)
+            except ValueError:
+                return self.failure("ParseError", f"Could not parse output: {self.output.decode(errors='replace')}")
+        finally:
+            if self.stderr is not None:
+                self.stderr.close()
+
+
+def serve(timeout: float, isolate_stderr: bool, results):
+    """Fork a child per request on stdin until it closes and every child has answered."""
+    children: dict[int, Child] = {}
+    pending = b""
+    stdin_open = True
+    while stdin_open or children:
+        deadline = min((child.deadline for child in children.values()), default=None)
+        wait = None if deadline is None else max(0.0, deadline - time.monotonic())
+        watched = ([sys.stdin.fileno()] if stdin_open else []) + list(children)
+        readable, _, _ = select.select(watched, [], [], wait)
+
+        finished = []
+        for fd in readable:
+            chunk = os.read(fd, 65536)
+            if fd == sys.stdin.fileno():
+                if not chunk:
+                    stdin_open = False
+                    continue
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    request_id, _, url = line.decode().strip().partition("\t")
+                    if url:
+                        inherited = [results.fileno(), *children]
+                        child = Child(request_id, url, timeout, isolate_stderr, inherited)
+                        children[child.fd] = child
+            elif chunk:
+                children[fd].output += chunk
+            else:
+                finished.append((children.pop(fd), False))
+
+        now = time.monotonic()
+        for fd in [fd for fd, child in children.items() if child.deadline <= now]:
+            finished.append((children.pop(fd), True))
+
+        for child, timed_out in finished:
+            results.write(json.dumps({"id": child.request_id, **child.finish(timed_out)}) + "\n")
+        results.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds each dataset may take to load")
+    parser.add_argument(
+        "--isolate-stderr",
+        action="store_true",
+        help="Give each child its own stderr file, quoted in its result if it fails, instead of sharing this process's",
+    )
+    args = parser.parse_args()
+
+    # Keep the original stdout as a private results channel and point fd 1 at
+    # stderr. Whatever else gets printed while loading, from Python or native
+    # code, then lands on stderr and cannot come between result lines.
+    results = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    preload_remote_protocols()
+    serve(args.timeout, args.isolate_stderr, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Shared handling of the per-release python/v<version>/ uv environments.
+
+Both generate_fixtures.py and validate_datasets.py run work inside these
+environments and need them synced first; this module keeps that logic in one
+place.
+"""
+
+import hashlib
+import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Written into the environment's .venv after a successful `uv sync`. It holds a
+# digest of the files that determine what the sync installs, so an unchanged
+# environment can skip the sync (and uv's resolve + filesystem walk) entirely.
+SYNC_STAMP = ".sync-stamp"
+_SYNC_INPUTS = ("uv.lock", "pyproject.toml")
+
+
+def env_dir_for(project_root: Path, version: str) -> Path:
+    """Directory of the uv project pinning spatialdata==<version>."""
+    return project_root / "python" / f"v{version}"
+
+
+def venv_python(env_dir: Path) -> Path:
+    """
+    The interpreter of env_dir's synced .venv.
+
+    Once `sync_env` has run, calling it directly skips `uv run`'s lockfile check
+    and extra process hop on every invocation.
+    """
+    return env_dir / ".venv" / ("Scripts" if os.name == "nt" else "bin") / "python"
+
+
+def subprocess_env() -> dict[str, str]:
+    """Environment for uv calls: an activated venv would otherwise shadow the target project's."""
+    env = os.environ.copy()
+    env.pop("VIRTUAL_ENV", None)
+    return env
+
+
+def lock_digest(env_dir: Path) -> str:
+    """Digest of the lockfile and project file that a sync installs from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in _SYNC_INPUTS:
+        digest.update(name.encode())
+        digest.update((env_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def needs_sync(env_dir: Path) -> bool:
+    """True unless the .venv was last synced from the current uv.lock and pyproject.toml."""
+    try:
+        return (env_dir / ".venv" / SYNC_STAMP).read_text() != lock_digest(env_dir)
+    except FileNotFoundError:
+        # No stamp yet, or no uv.lock for the sync to have been made from
+        return True
+
+
+def sync_env(env_dir: Path, project_root: Path) -> subprocess.CompletedProcess | None:
+    """
+    Run `uv sync` for env_dir unless its stamp shows it is already current.
+
+    Returns None when the sync was skipped, otherwise the completed process with
+    uv's stderr, which is where it reports progress and errors; its stdout is
+    discarded. The stamp is only written once a sync has succeeded.
+    """
+    if not needs_sync(env_dir):
+        return None
+    result = subprocess.run(
+        ["uv", "sync", "--directory", str(env_dir)],
+        cwd=project_root,
+        env=subprocess_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    if result.returncode == 0:
+        (env_dir / ".venv" / SYNC_STAMP).write_text(lock_digest(env_dir))
+    return result
+
+
+def sync_envs(env_dirs: list[Path], project_root: Path) -> list[subprocess.CompletedProcess | None]:
+    """
+    `sync_env` for several environments at once, results in input order.
+
+    The environments are disjoint directories, and each sync is a network-bound
+    resolve and download, so running them concurrently costs the slowest sync
+    rather than the sum of all of them.
+    """
+    if not env_dirs:
+        return []
+    with ThreadPoolExecutor(max_workers=len(env_dirs)) as executor:
+        return list(executor.map(lambda env_dir: sync_env(env_dir, project_root), env_dirs))
@@ -14,47 +14,103 @@ cheap to read incrementally over HTTP from `SpatialData.js`:
 Installing this distribution also registers the image codecs with zarr-python,
 so `spatialdata.read_zarr` can open stores written here — see
 `spatialdata_js_util.codecs.zarr_codec`.
+
+The names below are imported on first access rather than with the package, so
+`spatialdata-js-util --help` and other light entry points (which only import
+`cli`) do not pay for numpy, zarr, pandas and pyarrow up front.
 """
 
-from .codecs import (
-    CODEC_HTJ2K_LEGACY,
-    CODEC_HTJ2K_OPENJPH,
-    CODEC_JPEG2K,
-    backend_report,
-    htj2k_available,
-    is_htj2k_codec,
-    register_codecs,
-)
-from .images import (
-    HTJ2K_PRESETS,
-    HTJ2K_QUALITY_FLOOR_LSB,
-    JP2K_PRESETS,
-    RecompressedSpatialData,
-    dtype_quantum,
-    htj2k_preset_quality,
-    recompress_spatialdata,
-    resolve_recompression_config,
-)
-from .pyramids import (
-    PyramidResult,
-    add_pyramids,
-    has_pyramid,
-    resolve_scale_factors,
-)
-from .points import (
-    MORTON_CODE_2D_COLUMN,
-    MORTON_CODE_EXTREME_VALUE_INDICATOR,
-    build_spatialdata_multiscale_metadata,
-    morton_sort_points,
-    write_morton_points_parquet,
-    write_multiscale_points_parquet,
-)
-from .tables import (
-    CscConversion,
-    anndata_to_csc,
-    convert_store_tables_to_csc,
-    to_csc,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .codecs import (
+        CODEC_HTJ2K_LEGACY,
+        CODEC_HTJ2K_OPENJPH,
+        CODEC_JPEG2K,
+        backend_report,
+        htj2k_available,
+        is_htj2k_codec,
+        register_codecs,
+    )
+    from .images import (
+        HTJ2K_PRESETS,
+        HTJ2K_QUALITY_FLOOR_LSB,
+        JP2K_PRESETS,
+        RecompressedSpatialData,
+        dtype_quantum,
+        htj2k_preset_quality,
+        recompress_spatialdata,
+        resolve_recompression_config,
+    )
+    from .pyramids import (
+        PyramidResult,
+        add_pyramids,
+        has_pyramid,
+        resolve_scale_factors,
+    )
+    from .points import (
+        MORTON_CODE_2D_COLUMN,
+        MORTON_CODE_EXTREME_VALUE_INDICATOR,
+        build_spatialdata_multiscale_metadata,
+        morton_sort_points,
+        write_morton_points_parquet,
+        write_multiscale_points_parquet,
+    )
+    from .tables import (
+        CscConversion,
+        anndata_to_csc,
+        convert_store_tables_to_csc,
+        to_csc,
+    )
+
+_EXPORTS = {
+    "CODEC_HTJ2K_LEGACY": ".codecs",
+    "CODEC_HTJ2K_OPENJPH": ".codecs",
+    "CODEC_JPEG2K": ".codecs",
+    "backend_report": ".codecs",
+    "htj2k_available": ".codecs",
+    "is_htj2k_codec": ".codecs",
+    "register_codecs": ".codecs",
+    "HTJ2K_PRESETS": ".images",
+    "HTJ2K_QUALITY_FLOOR_LSB": ".images",
+    "JP2K_PRESETS": ".images",
+    "RecompressedSpatialData": ".images",
+    "dtype_quantum": ".images",
+    "htj2k_preset_quality": ".images",
+    "recompress_spatialdata": ".images",
+    "resolve_recompression_config": ".images",
+    "PyramidResult": ".pyramids",
+    "add_pyramids": ".pyramids",
+    "has_pyramid": ".pyramids",
+    "resolve_scale_factors": ".pyramids",
+    "MORTON_CODE_2D_COLUMN": ".points",
+    "MORTON_CODE_EXTREME_VALUE_INDICATOR": ".points",
+    "build_spatialdata_multiscale_metadata": ".points",
+    "morton_sort_points": ".points",
+    "write_morton_points_parquet": ".points",
+    "write_multiscale_points_parquet": ".points",
+    "CscConversion": ".tables",
+    "anndata_to_csc": ".tables",
+    "convert_store_tables_to_csc": ".tables",
+    "to_csc": ".tables",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS})
+
 
 __all__ = [
     "CODEC_HTJ2K_LEGACY",
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import spatialdata_js_util
+
+HEAVY_DEPENDENCIES = ("numpy", "zarr", "pandas", "pyarrow")
+
+
+def test_cli_import_does_not_load_heavy_dependencies() -> None:
+    # A fresh interpreter: this one has long since imported all of them.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, spatialdata_js_util.cli; "
+            f"print(' '.join(name for name in {HEAVY_DEPENDENCIES!r} if name in sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.stdout.split() == []
+
+
+@pytest.mark.parametrize("name", spatialdata_js_util.__all__)
+def test_exported_name_resolves_lazily(name: str) -> None:
+    module = importlib.import_module(spatialdata_js_util._EXPORTS[name], spatialdata_js_util.__name__)
+
+    assert spatialdata_js_util.__getattr__(name) is getattr(module, name)
+    assert name in dir(spatialdata_js_util)
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no_such_name"):
+        spatialdata_js_util.__getattr__("no_such_name")
@@ -0,0 +1,194 @@
+"""
+Regression tests for the dataset validation worker protocol in python/scripts.
+
+validate_datasets.py runs one validate_worker.py per spatialdata version and
+the worker forks a child per dataset. Here the worker runs under this
+interpreter against a stub `spatialdata` whose read_zarr behaves according to
+the URL it is given, so crashes, hangs and kills can be provoked on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import signal
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fsspec")
+
+_VALIDATION_SCRIPTS = Path(__file__).resolve().parents[2] / "scripts"
+if str(_VALIDATION_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_VALIDATION_SCRIPTS))
+
+import validate_datasets  # noqa: E402
+from validate_datasets import ValidationWorker, WorkerExited, WorkerPool  # noqa: E402
+
+STUB_SPATIALDATA = textwrap.dedent(
+    """
+    import os
+    import sys
+    import time
+
+    __version__ = "0.0.0"
+
+
+    class _SpatialData:
+        images = {"image": None}
+        labels = {}
+        points = {}
+        shapes = {"circles": None}
+        tables = {}
+        coordinate_systems = ["global"]
+
+
+    def read_zarr(url, **kwargs):
+        if "raise" in url:
+            raise ValueError("unreadable store")
+        if "crash" in url:
+            sys.stderr.write("about to crash\\n")
+            sys.stderr.flush()
+            os._exit(3)
+        if "hang" in url:
+            time.sleep(60)
+        if "noisy" in url:
+            print("noise from python")
+            os.write(1, b"noise from native code\\n")
+        return _SpatialData()
+    """
+)
+
+DATASET = {"name": "stub", "url": "file:///stub/ok.zarr"}
+
+
+@pytest.fixture
+def stub_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point workers at this interpreter, with the stub spatialdata importable."""
+    package = tmp_path / "stubs" / "spatialdata"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text(STUB_SPATIALDATA)
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join([str(package.parent), *sys.path]))
+    monkeypatch.setattr(validate_datasets, "venv_python", lambda env_dir: Path(sys.executable))
+    monkeypatch.setattr(validate_datasets, "TASK_TIMEOUT", 1)
+    monkeypatch.setattr(validate_datasets, "STARTUP_TIMEOUT", 1)
+    return tmp_path
+
+
+async def _start(project_root: Path) -> ValidationWorker:
+    return await ValidationWorker.start("0.0.0", project_root)
+
+
+@pytest.mark.asyncio
+async def test_worker_loads_dataset(stub_env: Path) -> None:
+    worker = await _start(stub_env)
+    try:
+        output = await worker.validate("file:///stub/ok.zarr", timeout=30)
+    finally:
+        await worker.close()
+
+    assert output == {
+        "success": True,
+        "elements": {"images": ["image"], "shapes": ["circles"]},
+        "coordinate_systems": ["global"],
+    }
+
+
+@pytest.mark.asyncio
+async def test_worker_reports_load_error(stub_env: Path) -> None:
+    worker = await _start(stub_env)
+    try:
+        output = await worker.validate("file:///stub/raise.zarr", timeout=30)
+    finally:
+        await worker.close()
+
+    assert output["success"] is False
+    assert output["error_type"] == "ValueError"
+    assert output["error_message"] == "unreadable store"
+
+
+@pytest.mark.asyncio
+async def test_child_crash_is_reported_and_worker_survives(stub_env: Path) -> None:
+    worker = await _start(stub_env)
+    try:
+        crashed = await worker.validate("file:///stub/crash.zarr", timeout=30)
+        after = await worker.validate("file:///stub/ok.zarr", timeout=30)
+        assert not worker.exited
+    finally:
+        await worker.close()
+
+    assert crashed["success"] is False
+    assert crashed["error_type"] == "WorkerExited"
+    assert "exited with code 3" in crashed["error_message"]
+    assert "about to crash" in crashed["error_message"]
+    assert after["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_child_hang_times_out_without_blocking_others(stub_env: Path) -> None:
+    worker = await _start(stub_env)
+    try:
+        hung, ok = await asyncio.gather(
+            worker.validate("file:///stub/hang.zarr", timeout=30),
+            worker.validate("file:///stub/ok.zarr", timeout=30),
+        )
+    finally:
+        await worker.close()
+
+    assert hung["success"] is False
+    assert hung["error_type"] == "TimeoutError"
+    assert "timed out after 1 seconds" in hung["error_message"]
+    assert ok["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_stdout_noise_does_not_corrupt_replies(stub_env: Path) -> None:
+    worker = await _start(stub_env)
+    try:
+        noisy, ok = await asyncio.gather(
+            worker.validate("file:///stub/noisy.zarr", timeout=30),
+            worker.validate("file:///stub/ok.zarr", timeout=30),
+        )
+    finally:
+        await worker.close()
+
+    assert noisy["success"] is True
+    assert ok["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_killed_worker_fails_pending_request_and_is_replaced(stub_env: Path) -> None:
+    async with WorkerPool(stub_env) as pool:
+        worker = await pool.worker("0.0.0")
+        pending = asyncio.create_task(worker.validate("file:///stub/hang.zarr", timeout=30))
+        await asyncio.sleep(0.5)
+        # Only the worker itself: its child loading the hanging dataset must
+        # not keep the reply pipe open
+        os.kill(worker.process.pid, signal.SIGKILL)
+
+        with pytest.raises(WorkerExited):
+            await asyncio.wait_for(pending, 10)
+        assert worker.exited
+
+        replacement = await pool.worker("0.0.0")
+        assert replacement is not worker
+        output = await replacement.validate("file:///stub/ok.zarr", timeout=30)
+    assert output["success"] is True
+
+
+@pytest.mark.asyncio
+async def test_backstop_reports_its_timeout_and_next_task_gets_fresh_worker(stub_env: Path) -> None:
+    async with WorkerPool(stub_env) as pool:
+        stuck = await pool.worker("0.0.0")
+        # A worker that stops answering altogether, as if wedged mid-import
+        os.kill(stuck.process.pid, signal.SIGSTOP)
+
+        timed_out = await validate_datasets.validate_with_version(DATASET, "0.0.0", pool)
+        after = await validate_datasets.validate_with_version(DATASET, "0.0.0", pool)
+
+    assert timed_out.error_type == "TimeoutError"
+    assert "timed out after 2 seconds" in timed_out.error_message
+    assert stuck.exited
+    assert after.success is True